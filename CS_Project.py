@@ -9,6 +9,12 @@ import mysql.connector
 from datetime import date
 import csv
 import matplotlib.pyplot as plt
+import array
+import json
+import mmap
+import struct
+import sys
+from collections import Counter
 
 
 # Database Configuration
@@ -18,17 +24,85 @@ DB_PASSWORD = "kali"
 DB_NAME = "cyber_crime_db"
 
 
+# Lookup Table Configuration
+STATUS_LABELS = ["Pending", "Under Investigation", "Solved", "Closed"]
+CRIME_TYPE_LABELS = ["Phishing", "Hacking", "Cyberbullying", "Identity Theft", "Fraud"]
+MIGRATION_BATCH_SIZE = 500
+
+# Lookup table behind each integer-coded column of crimes: (table, id column)
+LOOKUP_TABLES = {
+    "status_id": ("crime_statuses", "status_id"),
+    "crime_type_id": ("crime_types", "crime_type_id"),
+}
+
+# Crimes with status and crime type joined back to their labels
+CRIMES_WITH_LABELS_QUERY = """
+    SELECT
+        c.case_id, c.case_name, t.label AS crime_type, c.date_reported,
+        s.label AS status, c.victim_name, c.assigned_officer_id
+    FROM crimes c
+    LEFT JOIN crime_types t ON c.crime_type_id = t.crime_type_id
+    LEFT JOIN crime_statuses s ON c.status_id = s.status_id
+"""
+
+
+# Snapshot Configuration
+SNAPSHOT_FILE = "case_snapshot.bin"
+SNAPSHOT_MAGIC = b"CCSNAP01"
+SNAPSHOT_EPOCH = date(1970, 1, 1)
+NULL_CODE = -1               # NULL ids and category codes
+NULL_DAYS = -2147483648      # NULL dates (smallest 32-bit integer)
+
+# Columns stored for every table and how each one is encoded:
+#   id   -> 32-bit integers
+#   cat  -> 16-bit codes into a list of labels
+#   date -> 32-bit days since 1970-01-01
+#   str  -> offsets array followed by one UTF-8 blob
+SNAPSHOT_TABLES = {
+    "crimes": [
+        ("case_id", "id"),
+        ("case_name", "str"),
+        ("crime_type", "cat"),
+        ("date_reported", "date"),
+        ("status", "cat"),
+        ("victim_name", "str"),
+        ("assigned_officer_id", "id"),
+    ],
+    "officers": [
+        ("officer_id", "id"),
+        ("name", "str"),
+        ("designation", "cat"),
+        ("contact", "str"),
+    ],
+    "convicted_criminals": [
+        ("criminal_id", "id"),
+        ("case_id", "id"),
+        ("criminal_name", "str"),
+        ("date_caught", "date"),
+        ("location_caught", "str"),
+        ("punishment_details", "str"),
+    ],
+}
+
+
 # Global connection variable
 conn = None
 cursor = None
 
+# Menu choices that work from the snapshot file without the database
+OFFLINE_CHOICES = ['15', '16', '0']
+
+# Cached code maps, filled by load_code_maps(): {normalized label: (id, label)}
+status_codes = {}
+crime_type_codes = {}
+
 
 # ============================================================================
 # DATABASE FUNCTIONS
 # ============================================================================
 
 def connect_database():
-    """Connects to MySQL and creates database if needed"""
+    """Connects to MySQL and creates database if needed, returns False if it fails"""
     
     global conn, cursor
     
@@ -57,10 +131,13 @@ def connect_database():
         cursor = conn.cursor()
         print("✅ Connected to MySQL successfully!")
         create_tables()
+        return True
         
     except mysql.connector.Error as e:
         print(f"❌ Database connection failed: {e}")
-        exit()
+        conn = None
+        cursor = None
+        return False
 
 
 def create_tables():
@@ -76,16 +153,36 @@ def create_tables():
         )
     """)
     
+    # Lookup Tables
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS crime_statuses (
+            status_id SMALLINT UNSIGNED AUTO_INCREMENT PRIMARY KEY,
+            label VARCHAR(50) NOT NULL UNIQUE
+        )
+    """)
+
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS crime_types (
+            crime_type_id SMALLINT UNSIGNED AUTO_INCREMENT PRIMARY KEY,
+            label VARCHAR(30) NOT NULL UNIQUE
+        )
+    """)
+
+    add_lookup_labels("crime_statuses", STATUS_LABELS)
+    add_lookup_labels("crime_types", CRIME_TYPE_LABELS)
+
     # Crimes Table
     cursor.execute("""
         CREATE TABLE IF NOT EXISTS crimes (
             case_id INT AUTO_INCREMENT PRIMARY KEY,
             case_name VARCHAR(50) NOT NULL,
-            crime_type VARCHAR(30),
+            crime_type_id SMALLINT UNSIGNED,
             date_reported DATE,
-            status VARCHAR(50),
+            status_id SMALLINT UNSIGNED,
             victim_name VARCHAR(50),
             assigned_officer_id INT DEFAULT NULL,
+            FOREIGN KEY (crime_type_id) REFERENCES crime_types(crime_type_id),
+            FOREIGN KEY (status_id) REFERENCES crime_statuses(status_id),
             FOREIGN KEY (assigned_officer_id) REFERENCES officers(officer_id) ON DELETE SET NULL
         )
     """)
@@ -104,9 +201,128 @@ def create_tables():
     """)
     
     conn.commit()
+    migrate_crime_codes()
+    load_code_maps()
     print("✅ Tables created successfully!")
 
 
+def normalize_label(label):
+    """Lower-cases a label and collapses spaces, so 'solved ' matches 'Solved'"""
+    return " ".join(label.split()).lower()
+
+
+def add_lookup_labels(table, labels):
+    """Adds the labels that are missing from a lookup table"""
+    cursor.execute(f"SELECT label FROM {table}")
+    existing = {normalize_label(row[0]) for row in cursor.fetchall()}
+
+    # Only insert new labels, so no AUTO_INCREMENT ids are wasted on duplicates
+    missing = []
+    for label in labels:
+        key = normalize_label(label)
+        if key and key not in existing:
+            existing.add(key)
+            missing.append((" ".join(label.split()),))
+
+    if missing:
+        cursor.executemany(f"INSERT INTO {table} (label) VALUES (%s)", missing)
+        conn.commit()
+
+
+def load_code_maps():
+    """Loads status and crime type codes into memory for validating input"""
+    for column, codes in (("status_id", status_codes), ("crime_type_id", crime_type_codes)):
+        table, id_column = LOOKUP_TABLES[column]
+        cursor.execute(f"SELECT {id_column}, label FROM {table} ORDER BY {id_column}")
+        codes.clear()
+        for code, label in cursor.fetchall():
+            codes[normalize_label(label)] = (code, label)
+
+
+def lookup_code(codes, label):
+    """Returns the id for a label from a code map, or None if it is unknown"""
+    entry = codes.get(normalize_label(label))
+    return entry[0] if entry else None
+
+
+def column_exists(table, column):
+    """Checks whether a column exists in the current database"""
+    cursor.execute("""SELECT COUNT(*) FROM information_schema.COLUMNS
+                      WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s AND COLUMN_NAME = %s""",
+                   (table, column))
+    return cursor.fetchone()[0] > 0
+
+
+def migrated_label(label):
+    """Label an old text value moves to, blank values become 'Unknown'"""
+    return label.title() if label.strip() else "Unknown"
+
+
+def migrate_crime_codes():
+    """Moves old text status/crime_type columns of crimes onto the lookup tables"""
+    if not column_exists("crimes", "status"):
+        return
+
+    print("Migrating crime status and type to lookup tables...")
+
+    # Add the new code columns (skipped if an earlier migration was interrupted)
+    if not column_exists("crimes", "crime_type_id"):
+        cursor.execute("ALTER TABLE crimes ADD COLUMN crime_type_id SMALLINT UNSIGNED AFTER case_name")
+    if not column_exists("crimes", "status_id"):
+        cursor.execute("ALTER TABLE crimes ADD COLUMN status_id SMALLINT UNSIGNED AFTER date_reported")
+
+    # Every label already in use becomes a lookup entry, variants share one entry
+    cursor.execute("SELECT DISTINCT crime_type FROM crimes WHERE crime_type IS NOT NULL")
+    add_lookup_labels("crime_types", [migrated_label(row[0]) for row in cursor.fetchall()])
+    cursor.execute("SELECT DISTINCT status FROM crimes WHERE status IS NOT NULL")
+    add_lookup_labels("crime_statuses", [migrated_label(row[0]) for row in cursor.fetchall()])
+    load_code_maps()
+
+    # Fill the codes in batches of case_id, committing after each batch
+    last_id = 0
+    migrated = 0
+    while True:
+        cursor.execute("""SELECT case_id, crime_type, status FROM crimes
+                          WHERE case_id > %s ORDER BY case_id LIMIT %s""",
+                       (last_id, MIGRATION_BATCH_SIZE))
+        records = cursor.fetchall()
+        if not records:
+            break
+
+        updates = []
+        for case_id, crime_type, status in records:
+            crime_type_id = lookup_code(crime_type_codes, migrated_label(crime_type)) if crime_type is not None else None
+            status_id = lookup_code(status_codes, migrated_label(status)) if status is not None else None
+            updates.append((crime_type_id, status_id, case_id))
+
+        cursor.executemany("UPDATE crimes SET crime_type_id = %s, status_id = %s WHERE case_id = %s", updates)
+        conn.commit()
+        last_id = records[-1][0]
+        migrated += len(records)
+
+    cursor.execute("""
+        ALTER TABLE crimes
+            DROP COLUMN crime_type,
+            DROP COLUMN status,
+            ADD FOREIGN KEY (crime_type_id) REFERENCES crime_types(crime_type_id),
+            ADD FOREIGN KEY (status_id) REFERENCES crime_statuses(status_id)
+    """)
+    conn.commit()
+    print(f"✅ Migrated {migrated} crime records!")
+
+
+def count_crimes_by(column):
+    """Counts crimes per status_id or crime_type_id and joins back the labels"""
+    table, id_column = LOOKUP_TABLES[column]
+    # Group on the small integer code first, then look up each label once
+    cursor.execute(f"""
+        SELECT l.label, x.total
+        FROM (SELECT {column}, COUNT(*) AS total FROM crimes GROUP BY {column}) x
+        LEFT JOIN {table} l ON x.{column} = l.{id_column}
+    """)
+    return cursor.fetchall()
+
+
 def close_connection():
     """Closes database connection"""
     if conn:
@@ -126,21 +342,27 @@ def add_crime():
     
     case_name = input("Enter Case Name: ")
     
-    print("\nCrime Types: Phishing, Hacking, Cyberbullying, Identity Theft, Fraud")
-    crime_type = input("Enter Crime Type: ")
+    print("\nCrime Types: " + ", ".join(label for code, label in crime_type_codes.values()))
+    crime_type_id = lookup_code(crime_type_codes, input("Enter Crime Type: "))
+    if crime_type_id is None:
+        print("❌ Invalid crime type!")
+        return
     
     date_reported = input("Enter Date (YYYY-MM-DD): ")
     
-    print("\nStatus: Pending, Under Investigation, Solved, Closed")
-    status = input("Enter Status: ")
+    print("\nStatus: " + ", ".join(label for code, label in status_codes.values()))
+    status_id = lookup_code(status_codes, input("Enter Status: "))
+    if status_id is None:
+        print("❌ Invalid status!")
+        return
     
     victim_name = input("Enter Victim Name: ")
     
     # Insert into database
-    query = """INSERT INTO crimes (case_name, crime_type, date_reported, status, victim_name)
+    query = """INSERT INTO crimes (case_name, crime_type_id, date_reported, status_id, victim_name)
                VALUES (%s, %s, %s, %s, %s)"""
     
-    values = (case_name, crime_type, date_reported, status, victim_name)
+    values = (case_name, crime_type_id, date_reported, status_id, victim_name)
     
     try:
         cursor.execute(query, values)
@@ -160,8 +382,10 @@ def view_crimes():
     # LEFT JOIN ensures crimes without an assigned officer are still shown (Officer Name will be NULL).
     query = """
     SELECT 
-        c.case_id, c.case_name, c.crime_type, c.date_reported, c.status, o.name 
+        c.case_id, c.case_name, t.label, c.date_reported, s.label, o.name 
     FROM crimes c
+    LEFT JOIN crime_types t ON c.crime_type_id = t.crime_type_id
+    LEFT JOIN crime_statuses s ON c.status_id = s.status_id
     LEFT JOIN officers o ON c.assigned_officer_id = o.officer_id
     """
     
@@ -183,6 +407,10 @@ def view_crimes():
         # Handle cases where no officer is assigned
         officer_display = officer_name if officer_name else "N/A"
         
+        # Handle cases without a crime type or status
+        crime_type = crime_type if crime_type else "N/A"
+        status = status if status else "N/A"
+        
         print(f"{case_id:<5} {case_name:<20} {crime_type:<15} {status:<15} {officer_display:<25}")
 
 
@@ -194,7 +422,11 @@ def search_crime():
     
     search_term = input("Enter case name to search: ")
     
-    query = "SELECT case_id, case_name, crime_type, date_reported, status, victim_name FROM crimes WHERE case_name LIKE %s"
+    query = """SELECT c.case_id, c.case_name, t.label, c.date_reported, s.label, c.victim_name
+               FROM crimes c
+               LEFT JOIN crime_types t ON c.crime_type_id = t.crime_type_id
+               LEFT JOIN crime_statuses s ON c.status_id = s.status_id
+               WHERE c.case_name LIKE %s"""
     cursor.execute(query, (f"%{search_term}%",))
     records = cursor.fetchall()
     
@@ -207,6 +439,8 @@ def search_crime():
     
     for record in records:
         case_id, case_name, crime_type, date_rep, status, victim = record
+        crime_type = crime_type if crime_type else "N/A"
+        status = status if status else "N/A"
         print(f"{case_id:<5} {case_name:<25} {crime_type:<20} {status:<20}")
 
 
@@ -228,11 +462,14 @@ def update_crime_status():
         return
     
     print(f"Current Case: {result[0]}")
-    print("\nStatus Options: Pending, Under Investigation, Solved, Closed")
-    new_status = input("Enter new status: ")
+    print("\nStatus Options: " + ", ".join(label for code, label in status_codes.values()))
+    status_id = lookup_code(status_codes, input("Enter new status: "))
+    if status_id is None:
+        print("❌ Invalid status!")
+        return
     
-    query = "UPDATE crimes SET status = %s WHERE case_id = %s"
-    cursor.execute(query, (new_status, case_id))
+    query = "UPDATE crimes SET status_id = %s WHERE case_id = %s"
+    cursor.execute(query, (status_id, case_id))
     conn.commit()
     
     print("✅ Status updated successfully!")
@@ -407,8 +644,8 @@ def record_criminal():#Made By SHUBHAM ATRI
         # Optional: Automatically update the case status if a criminal is recorded
         confirm_update = input("Do you want to update the crime status to 'Solved'? (yes/no): ")
         if confirm_update.lower() == 'yes':
-            update_query = "UPDATE crimes SET status = 'Solved' WHERE case_id = %s"
-            cursor.execute(update_query, (case_id,))
+            update_query = "UPDATE crimes SET status_id = %s WHERE case_id = %s"
+            cursor.execute(update_query, (lookup_code(status_codes, "Solved"), case_id))
             conn.commit()
             print("✅ Crime status updated to 'Solved'.")
             
@@ -473,8 +710,7 @@ def generate_report():
     total = cursor.fetchone()[0]
     
     # Status-wise count
-    cursor.execute("SELECT status, COUNT(*) FROM crimes GROUP BY status")
-    status_data = cursor.fetchall()
+    status_data = count_crimes_by("status_id")
     
     print(f"\nTotal Crime Cases: {total}")
     print("\nStatus-wise Breakdown:")
@@ -482,17 +718,16 @@ def generate_report():
     
     for status, count in status_data:
         percentage = (count / total * 100) if total > 0 else 0
-        print(f"{status:<25}: {count:>3} ({percentage:.1f}%)")
+        print(f"{status or 'N/A':<25}: {count:>3} ({percentage:.1f}%)")
     
     # Crime type distribution
     print("\nCrime Type Distribution:")
     print("-" * 40)
-    cursor.execute("SELECT crime_type, COUNT(*) FROM crimes GROUP BY crime_type")
-    type_data = cursor.fetchall()
+    type_data = count_crimes_by("crime_type_id")
     
     for crime_type, count in type_data:
         percentage = (count / total * 100) if total > 0 else 0
-        print(f"{crime_type:<25}: {count:>3} ({percentage:.1f}%)")
+        print(f"{crime_type or 'N/A':<25}: {count:>3} ({percentage:.1f}%)")
 
 def visualize_data():
     """Show graphical crime statistics"""
@@ -501,14 +736,21 @@ def visualize_data():
     print("="*50)
 
     # --- Crime Type Distribution ---
-    cursor.execute("SELECT crime_type, COUNT(*) FROM crimes GROUP BY crime_type")
-    type_data = cursor.fetchall()
+    type_data = count_crimes_by("crime_type_id")
 
     if not type_data:
         print("No data available for visualization.")
         return
 
-    types = [row[0] for row in type_data]
+    # --- Status Distribution ---
+    status_data = count_crimes_by("status_id")
+
+    plot_crime_charts(type_data, status_data)
+
+
+def plot_crime_charts(type_data, status_data):
+    """Draws crime type and status charts from (label, count) rows"""
+    types = [row[0] or "N/A" for row in type_data]
     counts = [row[1] for row in type_data]
 
     plt.figure(figsize=(7, 4))
@@ -521,10 +763,7 @@ def visualize_data():
     plt.show()
 
     # --- Status Distribution ---
-    cursor.execute("SELECT status, COUNT(*) FROM crimes GROUP BY status")
-    status_data = cursor.fetchall()
-
-    statuses = [row[0] for row in status_data]
+    statuses = [row[0] or "N/A" for row in status_data]
     status_counts = [row[1] for row in status_data]
 
     plt.figure(figsize=(6, 4))
@@ -557,7 +796,7 @@ def export_data():
             if choice == 1:
                 print("Exporting Crime data to crime_data.csv...")
                 f_name = 'crime_data.csv'
-                cursor.execute("SELECT * FROM crimes")
+                cursor.execute(CRIMES_WITH_LABELS_QUERY)
                 headers = [i[0] for i in cursor.description]
                 records = cursor.fetchall()
                 
@@ -601,6 +840,301 @@ def export_data():
     
 
 
+# ============================================================================
+# OFFLINE SNAPSHOT FUNCTIONS
+# ============================================================================
+
+def encode_column(kind, values):
+    """Encodes one column of values into bytes plus any extra header info"""
+    if kind == "id":
+        codes = array.array("i", (NULL_CODE if v is None else v for v in values))
+        return codes.tobytes(), {}
+
+    if kind == "date":
+        days = array.array("i", (NULL_DAYS if v is None else (v - SNAPSHOT_EPOCH).days for v in values))
+        return days.tobytes(), {}
+
+    if kind == "cat":
+        # Each distinct label gets the next small integer code
+        labels = []
+        label_codes = {}
+        codes = array.array("h")
+        for v in values:
+            if v is None:
+                codes.append(NULL_CODE)
+                continue
+            if v not in label_codes:
+                label_codes[v] = len(labels)
+                labels.append(v)
+            codes.append(label_codes[v])
+        return codes.tobytes(), {"labels": labels}
+
+    # Strings: offsets[i]..offsets[i+1] is the slice of row i inside the blob.
+    # NULL strings are stored as empty strings.
+    offsets = array.array("I", [0])
+    blob = bytearray()
+    for v in values:
+        blob += (v or "").encode("utf-8")
+        offsets.append(len(blob))
+    return offsets.tobytes() + bytes(blob), {}
+
+
+def write_snapshot(path, tables):
+    """Writes rows of every snapshot table into one columnar file
+
+    tables maps a table name to its rows, each row ordered as in SNAPSHOT_TABLES.
+    File layout: magic, header length, JSON header, then the column data
+    (each column padded to 8 bytes so it can be read in place).
+    """
+    header = {"byteorder": sys.byteorder, "tables": {}}
+    chunks = []
+    position = 0
+
+    for table, columns in SNAPSHOT_TABLES.items():
+        rows = tables[table]
+        info = {"rows": len(rows), "columns": {}}
+
+        for index, (column, kind) in enumerate(columns):
+            data, extra = encode_column(kind, [row[index] for row in rows])
+            info["columns"][column] = {"kind": kind, "offset": position, "size": len(data), **extra}
+            padding = -len(data) % 8
+            chunks.append(data + b"\0" * padding)
+            position += len(data) + padding
+
+        header["tables"][table] = info
+
+    header_bytes = json.dumps(header).encode("utf-8")
+    header_bytes += b" " * (-(len(SNAPSHOT_MAGIC) + 4 + len(header_bytes)) % 8)
+
+    with open(path, "wb") as f:
+        f.write(SNAPSHOT_MAGIC)
+        f.write(struct.pack("<I", len(header_bytes)))
+        f.write(header_bytes)
+        for chunk in chunks:
+            f.write(chunk)
+
+    return len(SNAPSHOT_MAGIC) + 4 + len(header_bytes) + position
+
+
+class SnapshotRecord:
+    """One row of a snapshot table, values are decoded only when accessed"""
+
+    __slots__ = ("_table", "_index")
+
+    def __init__(self, table, index):
+        self._table = table
+        self._index = index
+
+    def __getattr__(self, column):
+        try:
+            return self._table.value(column, self._index)
+        except KeyError:
+            raise AttributeError(column) from None
+
+
+class SnapshotTable:
+    """Columns of one table, read straight out of the memory-mapped file"""
+
+    def __init__(self, info, data, keep):
+        self.rows = info["rows"]
+        self.columns = {}
+
+        for column, col in info["columns"].items():
+            kind = col["kind"]
+            region = keep(data[col["offset"]:col["offset"] + col["size"]])
+
+            if kind == "str":
+                split = (self.rows + 1) * 4
+                offsets = keep(keep(region[:split]).cast("I"))
+                self.columns[column] = (kind, offsets, keep(region[split:]))
+            elif kind == "cat":
+                self.columns[column] = (kind, keep(region.cast("h")), col["labels"])
+            else:
+                self.columns[column] = (kind, keep(region.cast("i")), None)
+
+    def __len__(self):
+        return self.rows
+
+    def __iter__(self):
+        for index in range(self.rows):
+            yield SnapshotRecord(self, index)
+
+    def value(self, column, index):
+        """Decodes a single value of a column"""
+        kind, codes, extra = self.columns[column]
+
+        if kind == "str":
+            return bytes(extra[codes[index]:codes[index + 1]]).decode("utf-8")
+
+        code = codes[index]
+        if kind == "cat":
+            return None if code == NULL_CODE else extra[code]
+        if kind == "date":
+            return None if code == NULL_DAYS else date.fromordinal(SNAPSHOT_EPOCH.toordinal() + code)
+        return None if code == NULL_CODE else code
+
+    def count_by(self, column):
+        """Counts rows per label of a categorical column, like GROUP BY"""
+        kind, codes, labels = self.columns[column]
+        counts = Counter(codes)
+        return [(None if code == NULL_CODE else labels[code], count) for code, count in counts.items()]
+
+
+class Snapshot:
+    """A snapshot file opened with mmap, tables are reached by name"""
+
+    def __init__(self, path):
+        self._views = []
+        self._map = None
+        self._file = open(path, "rb")
+
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+            if self._map[:len(SNAPSHOT_MAGIC)] != SNAPSHOT_MAGIC:
+                raise ValueError(f"{path} is not a snapshot file")
+
+            start = len(SNAPSHOT_MAGIC) + 4
+            (header_len,) = struct.unpack_from("<I", self._map, len(SNAPSHOT_MAGIC))
+            header = json.loads(self._map[start:start + header_len])
+
+            if header["byteorder"] != sys.byteorder:
+                raise ValueError(f"{path} was written on a {header['byteorder']}-endian machine")
+
+            data = self._keep(self._keep(memoryview(self._map))[start + header_len:])
+            self.tables = {name: SnapshotTable(info, data, self._keep)
+                           for name, info in header["tables"].items()}
+        except Exception:
+            self.close()
+            raise
+
+    def _keep(self, view):
+        """Remembers a memoryview so it can be released before unmapping"""
+        self._views.append(view)
+        return view
+
+    def __getitem__(self, table):
+        return self.tables[table]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        """Releases all views and unmaps the file"""
+        for view in reversed(self._views):
+            view.release()
+        self._views = []
+        if self._map is not None:
+            self._map.close()
+        self._file.close()
+
+
+def create_snapshot():
+    """Saves crimes, officers and criminals into the offline snapshot file"""
+    print("\n" + "="*50)
+    print("CREATE OFFLINE SNAPSHOT")
+    print("="*50)
+
+    tables = {}
+    try:
+        for table, columns in SNAPSHOT_TABLES.items():
+            if table == "crimes":
+                # Status and crime type are stored as labels, so join them back
+                cursor.execute(CRIMES_WITH_LABELS_QUERY)
+            else:
+                column_list = ", ".join(column for column, kind in columns)
+                cursor.execute(f"SELECT {column_list} FROM {table}")
+            tables[table] = cursor.fetchall()
+
+        size = write_snapshot(SNAPSHOT_FILE, tables)
+    except Exception as e:
+        print(f"❌ Error creating snapshot: {e}")
+        return
+
+    for table, rows in tables.items():
+        print(f"{table:<25}: {len(rows):>5} records")
+    print(f"\n✅ Snapshot saved to {SNAPSHOT_FILE} ({size} bytes)!")
+
+
+def open_snapshot():
+    """Opens the snapshot file, or returns None if it cannot be read"""
+    try:
+        return Snapshot(SNAPSHOT_FILE)
+    except FileNotFoundError:
+        print("❌ No snapshot found! Create one first.")
+    except Exception as e:
+        print(f"❌ Error reading snapshot: {e}")
+    return None
+
+
+def snapshot_report():
+    """Generate summary report from the snapshot, without the database"""
+    print("\n" + "="*50)
+    print("CRIME STATISTICS REPORT (SNAPSHOT)")
+    print("="*50)
+
+    snapshot = open_snapshot()
+    if not snapshot:
+        return
+
+    with snapshot:
+        crimes = snapshot["crimes"]
+        total = len(crimes)
+        status_data = crimes.count_by("status")
+        type_data = crimes.count_by("crime_type")
+
+    print(f"\nTotal Crime Cases: {total}")
+    print("\nStatus-wise Breakdown:")
+    print("-" * 40)
+
+    for status, count in status_data:
+        percentage = (count / total * 100) if total > 0 else 0
+        print(f"{status or 'N/A':<25}: {count:>3} ({percentage:.1f}%)")
+
+    print("\nCrime Type Distribution:")
+    print("-" * 40)
+
+    for crime_type, count in type_data:
+        percentage = (count / total * 100) if total > 0 else 0
+        print(f"{crime_type or 'N/A':<25}: {count:>3} ({percentage:.1f}%)")
+
+    if type_data:
+        show = input("\nShow charts? (yes/no): ")
+        if show.lower() == 'yes':
+            plot_crime_charts(type_data, status_data)
+
+
+def search_snapshot():
+    """Search crimes by case name in the snapshot"""
+    print("\n" + "="*50)
+    print("SEARCH CRIME CASES (SNAPSHOT)")
+    print("="*50)
+
+    search_term = input("Enter case name to search: ").lower()
+
+    snapshot = open_snapshot()
+    if not snapshot:
+        return
+
+    with snapshot:
+        records = [(crime.case_id, crime.case_name, crime.crime_type, crime.status)
+                   for crime in snapshot["crimes"]
+                   if search_term in crime.case_name.lower()]
+
+    if not records:
+        print("No matching records found!")
+        return
+
+    print(f"\n{'ID':<5} {'Case Name':<25} {'Type':<20} {'Status':<20}")
+    print("-" * 75)
+
+    for case_id, case_name, crime_type, status in records:
+        print(f"{case_id:<5} {case_name:<25} {crime_type or 'N/A':<20} {status or 'N/A':<20}")
+
+
 # ============================================================================
 # MAIN MENU
 # ============================================================================
@@ -631,6 +1165,11 @@ def display_menu():
     print("12. Export Data")
     print("13. Visualize Crime Data")
 
+    print("\n---- OFFLINE SNAPSHOT ----")
+    print("14. Create Offline Snapshot")
+    print("15. Snapshot Statistics Report")
+    print("16. Search Snapshot")
+
     print("\n0. Exit")
     print("="*50)
 
@@ -638,13 +1177,19 @@ def display_menu():
 def main():
     """Main program"""
     print("\n🚀 Starting Cyber Crime Management System...")
-    connect_database()
+    online = connect_database()
+    
+    if not online:
+        print("⚠️ Working offline: only the snapshot report and search can be used.")
     
     while True:
         display_menu()
         choice = input("\nEnter your choice: ")
         
-        if choice == '1':
+        if not online and choice not in OFFLINE_CHOICES:
+            print("❌ This option needs the database! Offline choices: 15, 16 or 0.")
+            
+        elif choice == '1':
             add_crime()
             
         elif choice == '2':
@@ -682,6 +1227,15 @@ def main():
 
         elif choice == '13':
             visualize_data()
+
+        elif choice == '14':
+            create_snapshot()
+
+        elif choice == '15':
+            snapshot_report()
+
+        elif choice == '16':
+            search_snapshot()
             
         elif choice == '0':
             close_connection()
@@ -696,9 +1250,10 @@ def main():
         input("\nPress Enter to continue...")
 
 
-try:
-    main()
-except KeyboardInterrupt:
-    print("\nApplication interrupted. Closing connection.")
-finally:
-    close_connection()
+if __name__ == "__main__":
+    try:
+        main()
+    except KeyboardInterrupt:
+        print("\nApplication interrupted. Closing connection.")
+    finally:
+        close_connection()
@@ -0,0 +1,400 @@
+"""
+Load Testing Harness
+Cyber Crime Management System
+
+Simulates several operators using the system at the same time against a
+local MySQL test database, and reports throughput, latency percentiles,
+lock waits and deadlock retries for every operation.
+
+Each simulated user runs in its own process with its own connection and
+calls the real menu functions of CS_Project with scripted answers.
+
+Example:
+    python load_test.py --users 10 --duration 60 --think-ms 200
+"""
+
+import argparse
+import math
+import multiprocessing
+import random
+import threading
+import time
+from datetime import date, timedelta
+
+import mysql.connector
+
+import CS_Project as app
+
+
+# Load Test Configuration
+TEST_DB_NAME = "cyber_crime_loadtest"
+LOCK_WAIT_TIMEOUT = 1205     # MySQL error: lock wait timeout exceeded
+DEADLOCK = 1213              # MySQL error: deadlock found, transaction rolled back
+START_TIMEOUT = 120          # seconds to wait for every user to be connected
+LOCK_WAIT_THRESHOLD = 0.001  # lock time (seconds) above which an operation counts as waiting
+
+# Relative weight of each operation in the default mix
+DEFAULT_MIX = {
+    "add_crime": 10,
+    "search_crime": 25,
+    "update_crime_status": 15,
+    "assign_officer": 15,
+    "record_criminal": 10,
+    "view_criminals_by_case": 20,
+    "generate_report": 5,
+}
+
+
+# Shared by all worker processes, set by init_worker()
+start_barrier = None
+
+# Lock wait meter of this worker's connection, set by run_user()
+lock_meter = None
+
+
+# ============================================================================
+# SIMULATED USER FUNCTIONS
+# ============================================================================
+
+class TrackingCursor:
+    """Wraps a cursor and remembers lock errors, even ones the app swallows"""
+
+    def __init__(self, cursor):
+        self._cursor = cursor
+        self.errors = []
+
+    def execute(self, query, params=None):
+        try:
+            return self._cursor.execute(query, params)
+        except mysql.connector.Error as e:
+            self.errors.append(e.errno)
+            raise
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+
+class TrackingConnection:
+    """Wraps a connection and counts the commits made by an operation"""
+
+    def __init__(self, conn):
+        self._conn = conn
+        self.commits = 0
+
+    def commit(self):
+        self._conn.commit()
+        self.commits += 1
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+
+class LockWaitMeter:
+    """Reads how long the statements of one connection waited for locks
+
+    Uses LOCK_TIME from performance_schema.events_statements_history, which
+    includes InnoDB row lock waits on MySQL 8.0.28 and later. The history
+    keeps the last 10 statements of each thread by default, which is more
+    than any single menu operation runs.
+    """
+
+    def __init__(self, conn):
+        self._cursor = conn.cursor()
+        self._cursor.execute("""SELECT THREAD_ID FROM performance_schema.threads
+                                WHERE PROCESSLIST_ID = CONNECTION_ID()""")
+        self._thread_id = self._cursor.fetchone()[0]
+        self._last_event = 0
+        self.read()
+
+    def read(self):
+        """Returns the lock time in seconds of the statements since the last read"""
+        self._cursor.execute("""SELECT COALESCE(SUM(LOCK_TIME), 0), MAX(EVENT_ID)
+                                FROM performance_schema.events_statements_history
+                                WHERE THREAD_ID = %s AND EVENT_ID > %s""",
+                             (self._thread_id, self._last_event))
+        lock_time, last_event = self._cursor.fetchone()
+        if last_event is not None:
+            self._last_event = last_event
+        # LOCK_TIME is in picoseconds
+        return int(lock_time) / 1e12
+
+
+def random_date(rng):
+    """Returns a random date from the last few years as YYYY-MM-DD"""
+    return str(date.today() - timedelta(days=rng.randrange(3 * 365)))
+
+
+def operation_inputs(name, rng, case_ids, officer_ids):
+    """Builds the answers an operator would type for one operation"""
+    case_id = str(rng.choice(case_ids))
+
+    if name == "add_crime":
+        return [f"Load case {rng.randrange(10**6)}", rng.choice(app.CRIME_TYPE_LABELS),
+                random_date(rng), rng.choice(app.STATUS_LABELS), "Load Victim"]
+    if name == "search_crime":
+        return [f"case {rng.randrange(100)}"]
+    if name == "update_crime_status":
+        return [case_id, rng.choice(app.STATUS_LABELS)]
+    if name == "assign_officer":
+        return [case_id, str(rng.choice(officer_ids))]
+    if name == "record_criminal":
+        return [case_id, f"Suspect {rng.randrange(10**6)}", random_date(rng),
+                "Load City", "Pending", rng.choice(["yes", "no"])]
+    if name == "view_criminals_by_case":
+        return [case_id]
+    return []
+
+
+def run_operation(name, answers, retries):
+    """Runs one operation, retrying on deadlocks and lock wait timeouts
+
+    An attempt is only retried if it committed nothing, otherwise running it
+    again would repeat the committed writes, so it counts as failed instead.
+    Returns (seconds, lock wait seconds, lock timeouts, deadlocks, retries used, failed).
+    """
+    lock_wait = 0
+    lock_timeouts = deadlocks = attempts = 0
+    start = time.perf_counter()
+
+    while True:
+        app.cursor.errors = []
+        app.conn.commits = 0
+        scripted = iter(answers)
+        app.input = lambda prompt="": next(scripted)
+        error = None
+
+        try:
+            getattr(app, name)()
+        except Exception as e:
+            error = e
+
+        # End the transaction so locks and read snapshots are not held between operations
+        app.conn.rollback()
+        lock_wait += lock_meter.read()
+
+        lock_timeouts += app.cursor.errors.count(LOCK_WAIT_TIMEOUT)
+        deadlocks += app.cursor.errors.count(DEADLOCK)
+        lock_error = LOCK_WAIT_TIMEOUT in app.cursor.errors or DEADLOCK in app.cursor.errors
+
+        if lock_error and app.conn.commits == 0 and attempts < retries:
+            attempts += 1
+            continue
+
+        # Errors the app catches and only prints still count as failures
+        failed = bool(app.cursor.errors) or error is not None
+        return time.perf_counter() - start, lock_wait, lock_timeouts, deadlocks, attempts, failed
+
+
+def init_worker(barrier):
+    """Keeps the start barrier in each worker process"""
+    global start_barrier
+    start_barrier = barrier
+
+
+def run_user(user_no, config):
+    """Simulates one operator until the test duration is over
+
+    Returns (samples, time of the first operation, end of the last operation).
+    """
+    global lock_meter
+    rng = random.Random(config["seed"] + user_no)
+    names = list(config["mix"])
+    weights = list(config["mix"].values())
+
+    # Each process has its own copy of CS_Project, so its globals are private
+    app.DB_NAME = config["database"]
+    app.print = lambda *args, **kwargs: None
+    try:
+        app.conn = TrackingConnection(mysql.connector.connect(
+            host=app.DB_HOST,
+            user=app.DB_USER,
+            password=app.DB_PASSWORD,
+            database=app.DB_NAME
+        ))
+        app.cursor = TrackingCursor(app.conn.cursor())
+        # A short timeout makes lock timeouts and retries show up within a test run
+        app.cursor.execute("SET SESSION innodb_lock_wait_timeout = %s", (config["lock_timeout"],))
+        lock_meter = LockWaitMeter(app.conn)
+        app.load_code_maps()
+        app.conn.rollback()
+    except Exception:
+        # Let the other users stop waiting instead of running without this one
+        start_barrier.abort()
+        raise
+
+    # Wait until every user is connected, so all of them run at the same time
+    start_barrier.wait(START_TIMEOUT)
+    end_time = time.time() + config["duration"]
+
+    samples = []
+    started = finished = time.time()
+    while time.time() < end_time:
+        name = rng.choices(names, weights)[0]
+        answers = operation_inputs(name, rng, config["case_ids"], config["officer_ids"])
+        samples.append((name,) + run_operation(name, answers, config["retries"]))
+        finished = time.time()
+
+        if config["think_ms"] > 0:
+            time.sleep(rng.expovariate(1000 / config["think_ms"]))
+
+    app.conn.close()
+    return samples, started, finished
+
+
+# ============================================================================
+# SETUP AND REPORT FUNCTIONS
+# ============================================================================
+
+def seed_database(cases, officers):
+    """Makes sure the test database has enough officers and cases to work on"""
+    app.cursor.execute("SELECT COUNT(*) FROM officers")
+    missing = officers - app.cursor.fetchone()[0]
+    if missing > 0:
+        app.cursor.executemany(
+            "INSERT INTO officers (name, designation, contact) VALUES (%s, %s, %s)",
+            [(f"Officer {i}", "Inspector", "9999999999") for i in range(missing)]
+        )
+
+    app.cursor.execute("SELECT COUNT(*) FROM crimes")
+    missing = cases - app.cursor.fetchone()[0]
+    if missing > 0:
+        rng = random.Random(0)
+        app.cursor.executemany(
+            """INSERT INTO crimes (case_name, crime_type_id, date_reported, status_id, victim_name)
+               VALUES (%s, %s, %s, %s, %s)""",
+            [(f"Seed case {i}",
+              app.lookup_code(app.crime_type_codes, rng.choice(app.CRIME_TYPE_LABELS)),
+              random_date(rng),
+              app.lookup_code(app.status_codes, rng.choice(app.STATUS_LABELS)),
+              "Seed Victim") for i in range(missing)]
+        )
+    app.conn.commit()
+
+    app.cursor.execute("SELECT case_id FROM crimes")
+    case_ids = [row[0] for row in app.cursor.fetchall()]
+    app.cursor.execute("SELECT officer_id FROM officers")
+    officer_ids = [row[0] for row in app.cursor.fetchall()]
+    return case_ids, officer_ids
+
+
+def row_lock_status():
+    """Reads InnoDB's server-wide row lock wait counters"""
+    app.cursor.execute("SHOW GLOBAL STATUS LIKE 'Innodb_row_lock_%'")
+    return {name: int(value) for name, value in app.cursor.fetchall()}
+
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0
+    return sorted_values[max(0, math.ceil(pct / 100 * len(sorted_values)) - 1)]
+
+
+def print_report(samples, elapsed, lock_before, lock_after):
+    """Prints throughput, latency and lock figures for each operation"""
+    print("\n" + "="*50)
+    print("LOAD TEST REPORT")
+    print("="*50)
+
+    by_operation = {}
+    for sample in samples:
+        by_operation.setdefault(sample[0], []).append(sample[1:])
+    by_operation["TOTAL"] = [sample[1:] for sample in samples]
+
+    print(f"\n{'Operation':<24} {'Ops':>6} {'Ops/s':>7} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} "
+          f"{'Waited':>7} {'Wait ms':>9} {'Lock TO':>8} {'Deadlk':>7} {'Retry':>6} {'Fail':>5}")
+    print("-" * 118)
+
+    for name, rows in by_operation.items():
+        latencies = sorted(row[0] * 1000 for row in rows)
+        waited = sum(1 for row in rows if row[1] > LOCK_WAIT_THRESHOLD)
+        print(f"{name:<24} {len(rows):>6} {len(rows) / elapsed:>7.1f} "
+              f"{percentile(latencies, 50):>8.1f} {percentile(latencies, 95):>8.1f} "
+              f"{percentile(latencies, 99):>8.1f} {waited:>7} {sum(row[1] for row in rows) * 1000:>9.1f} "
+              f"{sum(row[2] for row in rows):>8} {sum(row[3] for row in rows):>7} "
+              f"{sum(row[4] for row in rows):>6} {sum(row[5] for row in rows):>5}")
+
+    waits = lock_after["Innodb_row_lock_waits"] - lock_before["Innodb_row_lock_waits"]
+    wait_ms = lock_after["Innodb_row_lock_time"] - lock_before["Innodb_row_lock_time"]
+    print(f"\nInnoDB row lock waits (whole server): {waits}, total wait time {wait_ms} ms")
+
+
+def parse_mix(text):
+    """Parses 'add_crime=10,search_crime=30' into an operation weight map"""
+    mix = {}
+    for part in text.split(","):
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in DEFAULT_MIX:
+            raise argparse.ArgumentTypeError(f"unknown operation '{name}'")
+        mix[name] = float(weight or 1)
+    return mix
+
+
+def main():
+    """Sets up the test database, runs the simulated users and prints the report"""
+    parser = argparse.ArgumentParser(description="Load test the Cyber Crime Management System")
+    parser.add_argument("--users", type=int, default=10, help="number of concurrent users")
+    parser.add_argument("--duration", type=float, default=30, help="test length in seconds")
+    parser.add_argument("--think-ms", type=float, default=100, help="mean pause between operations")
+    parser.add_argument("--mix", type=parse_mix, default=DEFAULT_MIX,
+                        help="operation weights, e.g. add_crime=10,search_crime=30")
+    parser.add_argument("--retries", type=int, default=3, help="retries after a deadlock or lock timeout")
+    parser.add_argument("--lock-timeout", type=int, default=2,
+                        help="innodb_lock_wait_timeout in seconds for each user")
+    parser.add_argument("--cases", type=int, default=200, help="crime cases to seed")
+    parser.add_argument("--officers", type=int, default=20, help="officers to seed")
+    parser.add_argument("--database", default=TEST_DB_NAME, help="database to test against")
+    parser.add_argument("--seed", type=int, default=1, help="random seed")
+    args = parser.parse_args()
+
+    print("\n🚀 Preparing load test database...")
+    app.DB_NAME = args.database
+    if not app.connect_database():
+        return
+    case_ids, officer_ids = seed_database(max(args.cases, 1), max(args.officers, 1))
+
+    config = {
+        "duration": args.duration,
+        "database": args.database,
+        "mix": args.mix,
+        "think_ms": args.think_ms,
+        "retries": args.retries,
+        "lock_timeout": args.lock_timeout,
+        "seed": args.seed,
+        "case_ids": case_ids,
+        "officer_ids": officer_ids,
+    }
+
+    print(f"Running {args.users} users for {args.duration:g} seconds...")
+    lock_before = row_lock_status()
+
+    # Spawn fresh processes, so no worker inherits the open MySQL socket of this one
+    context = multiprocessing.get_context("spawn")
+    barrier = context.Barrier(args.users)
+    try:
+        with context.Pool(args.users, initializer=init_worker, initargs=(barrier,)) as pool:
+            results = pool.starmap(run_user, [(user_no, config) for user_no in range(args.users)],
+                                   chunksize=1)
+    except threading.BrokenBarrierError:
+        print(f"❌ Not all users connected within {START_TIMEOUT} seconds.")
+        app.close_connection()
+        return
+
+    lock_after = row_lock_status()
+
+    # Throughput only counts the time operations were running, not process start-up
+    windows = [(started, finished) for samples, started, finished in results if samples]
+    if not windows:
+        print("❌ No operations were run, try a longer --duration.")
+        app.close_connection()
+        return
+    elapsed = max(finished for started, finished in windows) - min(started for started, finished in windows)
+
+    all_samples = [sample for samples, started, finished in results for sample in samples]
+    print_report(all_samples, max(elapsed, 1e-9), lock_before, lock_after)
+    app.close_connection()
+
+
+if __name__ == "__main__":
+    main()